@@ -1,10 +1,19 @@
-from flask import Flask, jsonify, request
-from flask_cors import CORS
-import json
+from flask import Blueprint, Flask, Response, request
+import gzip
+import hashlib
+import mmap
+import numpy as np
+import orjson
 import os
+import pickle
+import sys
+import threading
+import uuid
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 app = Flask(__name__)
-CORS(app)
+api = Blueprint('api', __name__, url_prefix='/api')
 
 # Sample data structure based on your stats
 INVENTORY_DATA = {
@@ -113,69 +122,454 @@ INVENTORY_DATA = {
     }
 }
 
-@app.route('/api/summary', methods=['GET'])
-def get_summary():
-    """Get overall inventory summary statistics"""
-    return jsonify(INVENTORY_DATA["summary"])
+# The live dataset: an inventory plus everything derived from it.
+#   bu_summary, all_systems, systems_with_issues: aggregates from _build_indexes()
+#   bu_names, columns: column-oriented view of all_systems for vectorized
+#     filtering; row i of every array describes all_systems[i] and "bu_id"
+#     indexes into bu_names
+#   bu_keys: immutable set of valid business-unit names
+#   cache: serialized response bodies and ETags for this dataset, keyed by
+#     endpoint; the only mutable part, filled in by requests
+#   version: bumped on every publish
+# _publish replaces _STATE with a single assignment. Handlers read _STATE
+# once and use only that object, so a request never mixes two datasets.
+_Dataset = namedtuple('_Dataset', [
+    'inventory', 'bu_summary', 'all_systems', 'systems_with_issues',
+    'bu_names', 'columns', 'bu_keys', 'cache', 'version',
+])
+_STATE = None
 
-@app.route('/api/business-units', methods=['GET'])
-def get_business_units():
-    """Get all business units with their statistics"""
-    bu_data = {}
-    for bu_name, data in INVENTORY_DATA["business_units"].items():
-        bu_data[bu_name] = {
+# CORS headers are static for this read-only API, so they're attached when a
+# response is built instead of by a per-request after_request hook
+_CORS_HEADERS = {'Access-Control-Allow-Origin': '*'}
+_PREFLIGHT_HEADERS = {
+    **_CORS_HEADERS,
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, If-None-Match',
+    'Access-Control-Max-Age': '86400',
+}
+
+# Smaller bodies are sent uncompressed; gzip overhead outweighs the savings
+_GZIP_MIN_BYTES = 1024
+
+def _intern_repeated_values(inventory):
+    """Intern DNS server and issue strings in place.
+
+    A handful of resolvers and issue labels repeat across every system but
+    are parsed into separate string objects; interning collapses each to one
+    shared object.
+    """
+    for data in inventory["business_units"].values():
+        for system in data["systems"]:
+            system["dns_servers"][:] = map(sys.intern, system["dns_servers"])
+            system["issues"][:] = map(sys.intern, system["issues"])
+
+def _build_indexes(inventory):
+    """Precompute per-request aggregates from an inventory dict"""
+    bu_summary = {
+        bu_name: {
             "hosts_with_populated_entries": data["hosts_with_populated_entries"],
             "hosts_with_internet_routable_dns": data["hosts_with_internet_routable_dns"],
             "total_systems": len(data["systems"])
         }
-    return jsonify(bu_data)
+        for bu_name, data in inventory["business_units"].items()
+    }
+    # Each flattened system is a copy tagged with its business unit, made once
+    # per load instead of once per request
+    all_systems = [
+        {**system, "business_unit": bu_name}
+        for bu_name, data in inventory["business_units"].items()
+        for system in data["systems"]
+    ]
+    bu_names = tuple(inventory["business_units"])
+    n = len(all_systems)
+    columns = {
+        # all_systems is grouped by business unit in bu_names order
+        "bu_id": np.repeat(
+            np.arange(len(bu_names), dtype=np.int32),
+            [bu_summary[bu_name]["total_systems"] for bu_name in bu_names]),
+        "bigfix": np.fromiter((bool(system["bigfix"]) for system in all_systems), dtype=bool, count=n),
+        "has_issues": np.fromiter((bool(system["issues"]) for system in all_systems), dtype=bool, count=n),
+    }
+    systems_with_issues = [all_systems[i] for i in np.flatnonzero(columns["has_issues"])]
+    return bu_summary, all_systems, systems_with_issues, bu_names, columns
+
+def _publish(inventory, indexes=None, bodies=None):
+    """Build indexes for inventory, then make it the live dataset.
+
+    indexes and bodies may be supplied from a snapshot (see _restore_snapshot)
+    to skip rebuilding them. All work happens before _STATE is rebound, so
+    concurrent requests keep serving the previous dataset until the swap.
+    Returns the new dataset.
+    """
+    global _STATE
+    if indexes is None:
+        _intern_repeated_values(inventory)
+        indexes = _build_indexes(inventory)
+    bu_summary, all_systems, systems_with_issues, bu_names, columns = indexes
+    state = _Dataset(
+        inventory=inventory,
+        bu_summary=bu_summary,
+        all_systems=all_systems,
+        systems_with_issues=systems_with_issues,
+        bu_names=bu_names,
+        columns=columns,
+        bu_keys=frozenset(bu_names),
+        cache=dict(bodies or {}),
+        version=_STATE.version + 1 if _STATE is not None else 1,
+    )
+    _STATE = state
+    return state
+
+_publish(INVENTORY_DATA)
+
+def _json(obj, status=200):
+    """Serialize obj with orjson into a JSON response"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json',
+                    headers=_CORS_HEADERS)
+
+def _cache_entry(state, key, builder):
+    """Return the cached (body, etag, gzip_body) for key in state's cache.
+
+    builder(state) is serialized only on a cache miss. Bodies above
+    _GZIP_MIN_BYTES are also gzipped once here rather than per request.
+    Each dataset has its own cache, so a body is always stored with the
+    data it was built from.
+    """
+    entry = state.cache.get(key)
+    if entry is None:
+        body = orjson.dumps(builder(state))
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        gzip_body = None
+        if len(body) >= _GZIP_MIN_BYTES:
+            gzip_body = gzip.compress(body, compresslevel=6, mtime=0)
+        entry = (body, etag, gzip_body)
+        state.cache[key] = entry
+    return entry
+
+def _cached(state, key, builder):
+    """Return a JSON response for key from state's response cache.
+
+    Clients that accept gzip get the precompressed body. Requests whose
+    If-None-Match matches the ETag of the chosen representation get an
+    empty 304.
+    """
+    body, etag, gzip_body = _cache_entry(state, key, builder)
 
-@app.route('/api/business-units/<bu_name>', methods=['GET'])
+    headers = {**_CORS_HEADERS, 'Vary': 'Accept-Encoding'}
+    if gzip_body is not None and request.accept_encodings['gzip']:
+        body = gzip_body
+        etag += '-gzip'
+        headers['Content-Encoding'] = 'gzip'
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304, headers={**_CORS_HEADERS, 'Vary': 'Accept-Encoding'})
+    else:
+        response = Response(body, mimetype='application/json', headers=headers)
+    response.set_etag(etag)
+    return response
+
+@api.route('/summary', methods=['GET'])
+def get_summary():
+    """Get overall inventory summary statistics"""
+    return _cached(_STATE, 'summary', _ENDPOINT_BUILDERS['summary'])
+
+@api.route('/business-units', methods=['GET'])
+def get_business_units():
+    """Get all business units with their statistics"""
+    return _cached(_STATE, 'business-units', _ENDPOINT_BUILDERS['business-units'])
+
+@api.route('/business-units/<bu_name>', methods=['GET'])
 def get_business_unit_details(bu_name):
     """Get detailed information for a specific business unit"""
-    if bu_name not in INVENTORY_DATA["business_units"]:
-        return jsonify({"error": "Business unit not found"}), 404
+    state = _STATE
+    if bu_name not in state.bu_keys:
+        return _json({"error": "Business unit not found"}, 404)
     
-    return jsonify(INVENTORY_DATA["business_units"][bu_name])
+    return _cached(state, ('business-unit', bu_name),
+                   lambda state: state.inventory["business_units"][bu_name])
+
+# Query parameters understood by /systems; any others are ignored
+_SYSTEMS_FILTERS = ('bu', 'bigfix', 'has_issues', 'limit')
+# Accepted spellings for boolean query parameters
+_BOOL_ARGS = {'1': True, 'true': True, 'yes': True, '0': False, 'false': False, 'no': False}
+
+def _bool_arg(name):
+    """Return the boolean query parameter name, or None when it is absent.
 
-@app.route('/api/systems', methods=['GET'])
+    Raises ValueError for values not in _BOOL_ARGS.
+    """
+    value = request.args.get(name)
+    if value is None:
+        return None
+    try:
+        return _BOOL_ARGS[value.lower()]
+    except KeyError:
+        raise ValueError(f"{name} must be one of {', '.join(_BOOL_ARGS)}") from None
+
+# Systems serialized per chunk of a streamed response; a write per system
+# would be needlessly chatty
+_STREAM_BATCH = 256
+
+def _stream_systems(all_systems, rows):
+    """Yield the systems at rows as a JSON array, serializing batch by batch.
+
+    Used for per-request result sets that are never cached, so the full
+    body is never held in memory.
+    """
+    yield b'['
+    for start in range(0, len(rows), _STREAM_BATCH):
+        batch = b','.join(orjson.dumps(all_systems[i]) for i in rows[start:start + _STREAM_BATCH])
+        yield batch if start == 0 else b',' + batch
+    yield b']'
+
+def _select_systems(columns, bu_id=None, bigfix=None, has_issues=None, limit=None):
+    """Return indices of the systems matching every given filter, in order.
+
+    The filters are combined into one mask over the system columns, so only
+    the selected system dicts are ever serialized.
+    """
+    mask = np.ones(len(columns["bu_id"]), dtype=bool)
+    if bu_id is not None:
+        mask &= columns["bu_id"] == bu_id
+    if bigfix is not None:
+        mask &= columns["bigfix"] == bigfix
+    if has_issues is not None:
+        mask &= columns["has_issues"] == has_issues
+    return np.flatnonzero(mask)[:limit]
+
+@api.route('/systems', methods=['GET'])
 def get_all_systems():
-    """Get all systems across all business units"""
-    all_systems = []
-    for bu_name, data in INVENTORY_DATA["business_units"].items():
-        for system in data["systems"]:
-            system_with_bu = system.copy()
-            system_with_bu["business_unit"] = bu_name
-            all_systems.append(system_with_bu)
-    
-    return jsonify(all_systems)
+    """Get all systems across all business units.
 
-@app.route('/api/systems/issues', methods=['GET'])
+    Optional query parameters bu, bigfix, has_issues and limit narrow the
+    result on the server; without any of them the cached full body is served.
+    """
+    state = _STATE
+    if not any(name in request.args for name in _SYSTEMS_FILTERS):
+        return _cached(state, 'systems', _ENDPOINT_BUILDERS['systems'])
+
+    try:
+        bigfix = _bool_arg('bigfix')
+        has_issues = _bool_arg('has_issues')
+        limit = request.args.get('limit', type=int)
+        if 'limit' in request.args and (limit is None or limit < 0):
+            raise ValueError("limit must be a non-negative integer")
+    except ValueError as e:
+        return _json({"error": str(e)}, 400)
+
+    bu_id = None
+    bu_name = request.args.get('bu')
+    if bu_name is not None:
+        if bu_name not in state.bu_keys:
+            return _json({"error": "Business unit not found"}, 404)
+        bu_id = state.bu_names.index(bu_name)
+
+    rows = _select_systems(state.columns, bu_id, bigfix, has_issues, limit).tolist()
+    return Response(_stream_systems(state.all_systems, rows), mimetype='application/json',
+                    headers=_CORS_HEADERS)
+
+@api.route('/systems/issues', methods=['GET'])
 def get_systems_with_issues():
     """Get all systems that have issues"""
-    systems_with_issues = []
-    for bu_name, data in INVENTORY_DATA["business_units"].items():
-        for system in data["systems"]:
-            if system["issues"]:
-                system_with_bu = system.copy()
-                system_with_bu["business_unit"] = bu_name
-                systems_with_issues.append(system_with_bu)
-    
-    return jsonify(systems_with_issues)
+    return _cached(_STATE, 'systems/issues', _ENDPOINT_BUILDERS['systems/issues'])
+
+def _rollup(bu_ids, bigfix, has_issues, n_bus):
+    """Count systems, BigFix installs and systems with issues per business unit.
+
+    Returns an (n_bus, 3) int64 array; each column is a single vectorized
+    bincount over the system columns.
+    """
+    return np.column_stack([
+        np.bincount(bu_ids, minlength=n_bus),
+        np.bincount(bu_ids, weights=bigfix, minlength=n_bus),
+        np.bincount(bu_ids, weights=has_issues, minlength=n_bus),
+    ]).astype(np.int64)
+
+def _build_stats(state):
+    bu_names = state.bu_names
+    columns = state.columns
+    counts = _rollup(columns["bu_id"], columns["bigfix"], columns["has_issues"], len(bu_names))
+    business_units = {
+        bu_name: {
+            "systems": int(systems),
+            "systems_with_bigfix": int(with_bigfix),
+            "systems_with_issues": int(with_issues),
+        }
+        for bu_name, (systems, with_bigfix, with_issues) in zip(bu_names, counts.tolist())
+    }
+    systems, with_bigfix, with_issues = counts.sum(axis=0).tolist()
+    return {
+        "totals": {
+            "systems": systems,
+            "systems_with_bigfix": with_bigfix,
+            "systems_with_issues": with_issues,
+            "bigfix_coverage_percentage": round(100 * with_bigfix / systems, 2) if systems else 0.0,
+        },
+        "business_units": business_units,
+    }
+
+# Bodies for the fixed GET endpoints, keyed like the response cache. A load
+# pre-serializes all of them (see _warm_cache) before the snapshot is written.
+_ENDPOINT_BUILDERS = {
+    'summary': lambda state: state.inventory["summary"],
+    'business-units': lambda state: state.bu_summary,
+    'systems': lambda state: state.all_systems,
+    'systems/issues': lambda state: state.systems_with_issues,
+    'stats': _build_stats,
+}
+
+def _warm_cache(state):
+    """Serialize every fixed endpoint body of state ahead of the first request"""
+    for key, builder in _ENDPOINT_BUILDERS.items():
+        _cache_entry(state, key, builder)
+
+@api.route('/stats', methods=['GET'])
+def get_stats():
+    """Get per-business-unit system, BigFix and issue counts"""
+    return _cached(_STATE, 'stats', _ENDPOINT_BUILDERS['stats'])
+
+INVENTORY_PATH = 'parsed_inventory.json'
+# Files larger than this are rejected rather than parsed into memory
+MAX_INVENTORY_BYTES = int(os.getenv('MAX_INVENTORY_BYTES', 512 * 1024 * 1024))
+# Below this size a plain read() is cheaper than setting up a mapping
+_MMAP_MIN_BYTES = 64 * 1024 * 1024
 
-@app.route('/api/load-data', methods=['POST'])
+# After each load the parsed inventory, its indexes and the warmed response
+# bodies are pickled here so the next start can skip parsing and indexing.
+# The file is written by this app; don't point it at untrusted locations.
+SNAPSHOT_PATH = 'parsed_inventory.snapshot.pickle'
+_SNAPSHOT_FORMAT = 1
+
+def _source_signature(path):
+    """Identify a version of the inventory file by size and mtime"""
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns)
+
+def _write_snapshot(state, signature):
+    """Persist a dataset, its indexes and cached bodies to SNAPSHOT_PATH"""
+    # Request threads keep adding business-unit bodies while this runs on the
+    # loader thread, so pickle a copy; dict.copy() is atomic under the GIL
+    snapshot = {
+        "format": _SNAPSHOT_FORMAT,
+        "source": signature,
+        "inventory": state.inventory,
+        "indexes": (state.bu_summary, state.all_systems, state.systems_with_issues,
+                    state.bu_names, state.columns),
+        "bodies": state.cache.copy(),
+    }
+    tmp_path = SNAPSHOT_PATH + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=5)
+    os.replace(tmp_path, SNAPSHOT_PATH)
+
+def _restore_snapshot():
+    """Publish the last load's snapshot if the inventory file is unchanged since.
+
+    Returns True when the snapshot was used. Missing, stale or unreadable
+    snapshots are ignored.
+    """
+    try:
+        signature = _source_signature(INVENTORY_PATH)
+        with open(SNAPSHOT_PATH, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            snapshot = pickle.loads(mm)
+    except Exception:
+        return False
+    if snapshot.get("format") != _SNAPSHOT_FORMAT or snapshot.get("source") != signature:
+        return False
+    _publish(snapshot["inventory"], snapshot["indexes"], snapshot["bodies"])
+    return True
+
+def _parse_inventory(path, size):
+    """Parse the inventory file, memory-mapping it when it is large"""
+    with open(path, 'rb') as f:
+        if size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        # Parse straight out of the page cache rather than copying the whole
+        # file into a bytes object first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+# Loads run on a single background thread so a large parse never ties up a
+# request worker. Jobs are kept by id for status polling.
+_LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='inventory-load')
+_LOAD_JOBS = {}
+_ACTIVE_LOAD = None
+_LOAD_JOBS_LOCK = threading.Lock()
+# Finished jobs kept for status polling; older ones are forgotten
+_MAX_FINISHED_JOBS = 16
+
+def _prune_load_jobs():
+    """Drop all but the newest _MAX_FINISHED_JOBS finished jobs.
+
+    Call with _LOAD_JOBS_LOCK held. A running job is never dropped.
+    """
+    finished = [job_id for job_id, future in _LOAD_JOBS.items() if future.done()]
+    for job_id in finished[:-_MAX_FINISHED_JOBS]:
+        del _LOAD_JOBS[job_id]
+
+def _load_inventory(path, size):
+    """Parse the inventory file and publish it (runs on _LOAD_EXECUTOR)"""
+    signature = _source_signature(path)
+    state = _publish(_parse_inventory(path, size))
+    _warm_cache(state)
+    try:
+        _write_snapshot(state, signature)
+    except Exception as e:
+        # The load itself succeeded; only the next warm start is affected
+        app.logger.warning("Could not write inventory snapshot: %s", e)
+
+@api.route('/load-data', methods=['POST'])
 def load_data():
-    """Load data from parsed_inventory.json file"""
+    """Start loading data from parsed_inventory.json in the background"""
+    global _ACTIVE_LOAD
     try:
-        if os.path.exists('parsed_inventory.json'):
-            with open('parsed_inventory.json', 'r') as f:
-                global INVENTORY_DATA
-                INVENTORY_DATA = json.load(f)
-            return jsonify({"message": "Data loaded successfully"})
-        else:
-            return jsonify({"error": "parsed_inventory.json not found"}), 404
+        if not os.path.exists(INVENTORY_PATH):
+            return _json({"error": f"{INVENTORY_PATH} not found"}, 404)
+        size = os.path.getsize(INVENTORY_PATH)
+        if size > MAX_INVENTORY_BYTES:
+            return _json({
+                "error": f"{INVENTORY_PATH} is {size} bytes, above the {MAX_INVENTORY_BYTES} byte limit"
+            }, 413)
+        with _LOAD_JOBS_LOCK:
+            if _ACTIVE_LOAD is not None and not _LOAD_JOBS[_ACTIVE_LOAD].done():
+                return _json({"error": "A data load is already in progress", "job": _ACTIVE_LOAD}, 409)
+            job_id = uuid.uuid4().hex
+            _LOAD_JOBS[job_id] = _LOAD_EXECUTOR.submit(_load_inventory, INVENTORY_PATH, size)
+            _ACTIVE_LOAD = job_id
+            _prune_load_jobs()
+        return _json({"job": job_id, "status": "pending"}, 202)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return _json({"error": str(e)}, 500)
+
+@api.route('/load-data/<job_id>', methods=['GET'])
+def get_load_status(job_id):
+    """Get the status of a background data load"""
+    future = _LOAD_JOBS.get(job_id)
+    if future is None:
+        return _json({"error": "Load job not found"}, 404)
+    if not future.done():
+        return _json({"job": job_id, "status": "running" if future.running() else "pending"})
+    error = future.exception()
+    if error is not None:
+        return _json({"job": job_id, "status": "failed", "error": str(error)})
+    return _json({"job": job_id, "status": "done", "message": "Data loaded successfully"})
+
+@api.before_request
+def preflight():
+    """Answer CORS preflight requests for every API route.
+
+    Flask routes OPTIONS to each existing rule automatically, so only real
+    endpoints get here; unknown /api paths still 404.
+    """
+    if request.method == 'OPTIONS':
+        return Response(status=204, headers=_PREFLIGHT_HEADERS)
+
+app.register_blueprint(api)
+
+_restore_snapshot()
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # Development server only; production runs under gunicorn (see wsgi.py)
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', host='0.0.0.0', port=5001)
@@ -12,6 +12,7 @@ When running locally, it falls back to Azure CLI authentication.
 
 Usage:
     ./azure_dns_export.py --output dns_records.csv
+    ./azure_dns_export.py --output dns_records.csv --max-workers 32 --verbose
 
 Environment Variables (optional):
     AZURE_SUBSCRIPTION_ID - (Optional) Specific subscription ID to limit scope
@@ -21,11 +22,15 @@ from __future__ import annotations
 
 import argparse
 import csv
+import logging
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
     from azure.identity import DefaultAzureCredential
@@ -33,12 +38,52 @@ try:
     from azure.mgmt.dns import DnsManagementClient
     from azure.mgmt.privatedns import PrivateDnsManagementClient
     from azure.core.exceptions import AzureError, HttpResponseError
+    from azure.core.pipeline.transport import RequestsTransport
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError as e:
     print(f"Error: Missing required Azure SDK packages. Please install:")
     print(f"  pip install azure-identity azure-mgmt-resource azure-mgmt-dns azure-mgmt-privatedns")
     sys.exit(1)
 
 
+# Record types exported from each kind of zone; anything else is skipped
+PUBLIC_RECORD_TYPES = frozenset(
+    ("A", "AAAA", "CNAME", "MX", "NS", "PTR", "SOA", "SRV", "TXT", "CAA")
+)
+PRIVATE_RECORD_TYPES = frozenset(
+    ("A", "AAAA", "CNAME", "MX", "PTR", "SOA", "SRV", "TXT")
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Log an INFO progress line after this many zones; per-zone lines are DEBUG
+PROGRESS_EVERY = 50
+
+# Page size for DNS zone and record set listings (the service default is 100).
+# Not used for resource groups, where $top caps the total rather than the page.
+ARM_PAGE_SIZE = 500
+
+# Output file buffer; rows are small, so a large buffer cuts write() syscalls
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# CSV column order; must match DNSRecord.as_row() and the keys of to_dict()
+CSV_FIELDNAMES = [
+    "Subscription ID",
+    "Subscription Name",
+    "Resource Group",
+    "Zone Name",
+    "Zone Type",
+    "Record Name",
+    "Record Type",
+    "TTL",
+    "RDATA",
+    "FQDN",
+]
+
+
 @dataclass
 class DNSRecord:
     """Represents a DNS record for CSV export"""
@@ -68,6 +113,21 @@ class DNSRecord:
             "FQDN": self.fqdn,
         }
 
+    def as_row(self) -> Tuple[str, ...]:
+        """Convert to a row tuple in CSV_FIELDNAMES order"""
+        return (
+            self.subscription_id,
+            self.subscription_name,
+            self.resource_group,
+            self.zone_name,
+            self.zone_type,
+            self.record_name,
+            self.record_type,
+            str(self.ttl),
+            self.rdata,
+            self.fqdn,
+        )
+
 
 class AzureDNSExporter:
     """Main class for exporting Azure DNS records"""
@@ -75,6 +135,7 @@ class AzureDNSExporter:
     def __init__(
         self,
         subscription_id: Optional[str] = None,
+        max_workers: int = 16,
     ):
         """
         Initialize Azure DNS Exporter with Managed Identity
@@ -88,13 +149,42 @@ class AzureDNSExporter:
 
         Args:
             subscription_id: Optional specific subscription ID to limit scope
+            max_workers: Number of concurrent ARM requests during export
         """
         self.subscription_id = subscription_id
-        print("Authenticating with Azure using Managed Identity...")
+        self.max_workers = max_workers
+        logger.info("Authenticating with Azure using Managed Identity...")
         self.credential = DefaultAzureCredential()
+        self.transport = self._build_transport(max_workers)
         self.resource_client: Optional[ResourceManagementClient] = None
         self.dns_client: Optional[DnsManagementClient] = None
         self.private_dns_client: Optional[PrivateDnsManagementClient] = None
+        self._subscriptions: Optional[List[Dict[str, str]]] = None
+        # Per-subscription clients, shared by the export worker threads
+        self._dns_clients: Dict[str, DnsManagementClient] = {}
+        self._private_dns_clients: Dict[str, PrivateDnsManagementClient] = {}
+        self._clients_lock = threading.Lock()
+
+    @staticmethod
+    def _build_transport(max_workers: int) -> RequestsTransport:
+        """
+        Build one HTTP transport shared by every management client
+
+        All clients talk to management.azure.com, so sharing a session lets
+        worker threads reuse pooled TLS connections across subscriptions.
+        The pool is sized to the worker count. urllib3 retries stay disabled
+        (as in the SDK's own default session) so the SDK retry policy alone
+        handles throttling.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return RequestsTransport(session=session, session_owner=False)
 
     def _get_resource_client(self) -> ResourceManagementClient:
         """Get or create ResourceManagementClient"""
@@ -106,40 +196,59 @@ class AzureDNSExporter:
                 raise ValueError("No subscriptions found for the provided credentials")
             sub_id = self.subscription_id or subs[0]["subscription_id"]
             self.resource_client = ResourceManagementClient(
-                self.credential, sub_id
+                self.credential, sub_id, transport=self.transport
             )
         return self.resource_client
 
     def _get_dns_client(self, subscription_id: str) -> DnsManagementClient:
-        """Get DNS client for a specific subscription"""
-        return DnsManagementClient(self.credential, subscription_id)
+        """Get (or create and cache) the DNS client for a specific subscription"""
+        with self._clients_lock:
+            client = self._dns_clients.get(subscription_id)
+            if client is None:
+                client = DnsManagementClient(
+                    self.credential, subscription_id, transport=self.transport
+                )
+                self._dns_clients[subscription_id] = client
+            return client
 
     def _get_private_dns_client(
         self, subscription_id: str
     ) -> PrivateDnsManagementClient:
-        """Get Private DNS client for a specific subscription"""
-        return PrivateDnsManagementClient(self.credential, subscription_id)
+        """Get (or create and cache) the Private DNS client for a specific subscription"""
+        with self._clients_lock:
+            client = self._private_dns_clients.get(subscription_id)
+            if client is None:
+                client = PrivateDnsManagementClient(
+                    self.credential, subscription_id, transport=self.transport
+                )
+                self._private_dns_clients[subscription_id] = client
+            return client
 
     def _list_subscriptions(self) -> List[Dict[str, str]]:
-        """List all accessible subscriptions"""
+        """List all accessible subscriptions (fetched once, then cached)"""
+        if self._subscriptions is not None:
+            return self._subscriptions
         try:
             from azure.mgmt.resource.subscriptions import SubscriptionClient
 
-            sub_client = SubscriptionClient(self.credential)
+            sub_client = SubscriptionClient(self.credential, transport=self.transport)
             subscriptions = []
-            print("Discovering accessible subscriptions...")
+            logger.info("Discovering accessible subscriptions...")
             for sub in sub_client.subscriptions.list():
                 sub_info = {
                     "subscription_id": sub.subscription_id,
                     "subscription_name": sub.display_name or sub.subscription_id,
                 }
                 subscriptions.append(sub_info)
-                print(f"  Found subscription: {sub_info['subscription_name']} ({sub_info['subscription_id']})")
+                logger.info(
+                    "Found subscription: %s (%s)",
+                    sub_info["subscription_name"],
+                    sub_info["subscription_id"],
+                )
+            self._subscriptions = subscriptions
             return subscriptions
         except Exception as e:
-            print(f"Error listing subscriptions: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error listing subscriptions: %s", e)
             return []
 
     def _list_resource_groups(
@@ -148,14 +257,14 @@ class AzureDNSExporter:
         """List all resource groups in a subscription"""
         try:
             resource_client = ResourceManagementClient(
-                self.credential, subscription_id
+                self.credential, subscription_id, transport=self.transport
             )
             resource_groups = []
             for rg in resource_client.resource_groups.list():
                 resource_groups.append(rg.name)
             return resource_groups
         except Exception as e:
-            print(f"Error listing resource groups in {subscription_id}: {e}")
+            logger.error("Error listing resource groups in %s: %s", subscription_id, e)
             return []
 
     def _list_all_public_dns_zones(
@@ -165,14 +274,14 @@ class AzureDNSExporter:
         try:
             dns_client = self._get_dns_client(subscription_id)
             zones = []
-            for zone in dns_client.zones.list():
+            for zone in dns_client.zones.list(top=ARM_PAGE_SIZE):
                 zones.append({
                     "name": zone.name,
                     "resource_group": zone.id.split("/resourceGroups/")[1].split("/")[0] if "/resourceGroups/" in zone.id else "unknown"
                 })
             return zones
         except Exception as e:
-            print(f"Error listing public DNS zones in subscription {subscription_id}: {e}")
+            logger.error("Error listing public DNS zones in subscription %s: %s", subscription_id, e)
             return []
 
     def _list_all_private_dns_zones(
@@ -182,14 +291,14 @@ class AzureDNSExporter:
         try:
             private_dns_client = self._get_private_dns_client(subscription_id)
             zones = []
-            for zone in private_dns_client.private_zones.list():
+            for zone in private_dns_client.private_zones.list(top=ARM_PAGE_SIZE):
                 zones.append({
                     "name": zone.name,
                     "resource_group": zone.id.split("/resourceGroups/")[1].split("/")[0] if "/resourceGroups/" in zone.id else "unknown"
                 })
             return zones
         except Exception as e:
-            print(f"Error listing private DNS zones in subscription {subscription_id}: {e}")
+            logger.error("Error listing private DNS zones in subscription %s: %s", subscription_id, e)
             return []
 
     def _get_record_sets_public(
@@ -204,70 +313,61 @@ class AzureDNSExporter:
         try:
             dns_client = self._get_dns_client(subscription_id)
 
-            # Get all record types
-            record_types = [
-                "A",
-                "AAAA",
-                "CNAME",
-                "MX",
-                "NS",
-                "PTR",
-                "SOA",
-                "SRV",
-                "TXT",
-                "CAA",
-            ]
+            # One paged listing returns every record type in the zone
+            record_sets = dns_client.record_sets.list_by_dns_zone(
+                resource_group_name=resource_group,
+                zone_name=zone_name,
+                top=ARM_PAGE_SIZE,
+            )
 
-            for record_type in record_types:
-                try:
-                    record_sets = dns_client.record_sets.list_by_type(
-                        resource_group_name=resource_group,
+            zone_suffix = f".{zone_name}"
+            zone_suffix_len = len(zone_suffix)
+
+            for record_set in record_sets:
+                # e.g. "Microsoft.Network/dnszones/A" -> "A"
+                record_type = record_set.type.rsplit("/", 1)[-1]
+                if record_type not in PUBLIC_RECORD_TYPES:
+                    continue
+
+                # Skip SOA and NS records at zone apex (these are zone-level)
+                if record_type in ("SOA", "NS") and record_set.name == "@":
+                    continue
+
+                # Format RDATA based on record type
+                rdata = self._format_rdata(record_set, record_type)
+
+                record_name = record_set.name.rstrip(".")
+                if record_name == "@":
+                    record_name = zone_name
+                else:
+                    # Remove zone name suffix if present
+                    if record_name.endswith(zone_suffix):
+                        record_name = record_name[:-zone_suffix_len]
+                    record_name += zone_suffix
+
+                fqdn = (getattr(record_set, "fqdn", None) or record_name).rstrip(".")
+
+                records.append(
+                    DNSRecord(
+                        subscription_id=subscription_id,
+                        subscription_name=subscription_name,
+                        resource_group=resource_group,
                         zone_name=zone_name,
+                        zone_type="Public",
+                        record_name=record_name,
                         record_type=record_type,
+                        ttl=record_set.ttl or 3600,
+                        rdata=rdata,
+                        fqdn=fqdn,
                     )
-
-                    for record_set in record_sets:
-                        # Skip SOA and NS records at zone apex (these are zone-level)
-                        if record_type in ("SOA", "NS") and record_set.name == "@":
-                            continue
-
-                        # Format RDATA based on record type
-                        rdata = self._format_rdata(record_set, record_type)
-
-                        record_name = record_set.name.rstrip(".")
-                        if record_name == "@":
-                            record_name = zone_name
-                        else:
-                            # Remove zone name suffix if present
-                            if record_name.endswith(f".{zone_name}"):
-                                record_name = record_name[: -len(f".{zone_name}")]
-                            record_name = f"{record_name}.{zone_name}"
-
-                        fqdn = record_set.fqdn.rstrip(".") if hasattr(record_set, "fqdn") else record_name
-
-                        records.append(
-                            DNSRecord(
-                                subscription_id=subscription_id,
-                                subscription_name=subscription_name,
-                                resource_group=resource_group,
-                                zone_name=zone_name,
-                                zone_type="Public",
-                                record_name=record_name,
-                                record_type=record_type,
-                                ttl=record_set.ttl or 3600,
-                                rdata=rdata,
-                                fqdn=fqdn,
-                            )
-                        )
-                except HttpResponseError as e:
-                    if e.status_code != 404:
-                        print(
-                            f"Warning: Could not list {record_type} records in {zone_name}: {e}"
-                        )
-                    continue
+                )
+        except HttpResponseError as e:
+            if e.status_code != 404:
+                logger.warning("Could not list records in %s: %s", zone_name, e)
         except Exception as e:
-            print(
-                f"Error getting record sets from public zone {zone_name} in {resource_group}: {e}"
+            logger.error(
+                "Error getting record sets from public zone %s in %s: %s",
+                zone_name, resource_group, e,
             )
 
         return records
@@ -284,116 +384,105 @@ class AzureDNSExporter:
         try:
             private_dns_client = self._get_private_dns_client(subscription_id)
 
-            record_types = [
-                "A",
-                "AAAA",
-                "CNAME",
-                "MX",
-                "PTR",
-                "SOA",
-                "SRV",
-                "TXT",
-            ]
+            # One paged listing returns every record type in the zone
+            record_sets = private_dns_client.record_sets.list(
+                resource_group_name=resource_group,
+                private_zone_name=zone_name,
+                top=ARM_PAGE_SIZE,
+            )
 
-            for record_type in record_types:
-                try:
-                    record_sets = private_dns_client.record_sets.list_by_type(
-                        resource_group_name=resource_group,
-                        private_zone_name=zone_name,
-                        record_type=record_type,
-                    )
+            zone_suffix = f".{zone_name}"
+            zone_suffix_len = len(zone_suffix)
 
-                    for record_set in record_sets:
-                        # Skip SOA records at zone apex
-                        if record_type == "SOA" and record_set.name == "@":
-                            continue
-
-                        rdata = self._format_rdata(record_set, record_type)
-
-                        record_name = record_set.name.rstrip(".")
-                        if record_name == "@":
-                            record_name = zone_name
-                        else:
-                            if record_name.endswith(f".{zone_name}"):
-                                record_name = record_name[: -len(f".{zone_name}")]
-                            record_name = f"{record_name}.{zone_name}"
-
-                        fqdn = record_set.fqdn.rstrip(".") if hasattr(record_set, "fqdn") else record_name
-
-                        records.append(
-                            DNSRecord(
-                                subscription_id=subscription_id,
-                                subscription_name=subscription_name,
-                                resource_group=resource_group,
-                                zone_name=zone_name,
-                                zone_type="Private",
-                                record_name=record_name,
-                                record_type=record_type,
-                                ttl=record_set.ttl or 3600,
-                                rdata=rdata,
-                                fqdn=fqdn,
-                            )
-                        )
-                except HttpResponseError as e:
-                    if e.status_code != 404:
-                        print(
-                            f"Warning: Could not list {record_type} records in private zone {zone_name}: {e}"
-                        )
+            for record_set in record_sets:
+                # e.g. "Microsoft.Network/privateDnsZones/A" -> "A"
+                record_type = record_set.type.rsplit("/", 1)[-1]
+                if record_type not in PRIVATE_RECORD_TYPES:
+                    continue
+
+                # Skip SOA records at zone apex
+                if record_type == "SOA" and record_set.name == "@":
                     continue
+
+                rdata = self._format_rdata(record_set, record_type)
+
+                record_name = record_set.name.rstrip(".")
+                if record_name == "@":
+                    record_name = zone_name
+                else:
+                    if record_name.endswith(zone_suffix):
+                        record_name = record_name[:-zone_suffix_len]
+                    record_name += zone_suffix
+
+                fqdn = (getattr(record_set, "fqdn", None) or record_name).rstrip(".")
+
+                records.append(
+                    DNSRecord(
+                        subscription_id=subscription_id,
+                        subscription_name=subscription_name,
+                        resource_group=resource_group,
+                        zone_name=zone_name,
+                        zone_type="Private",
+                        record_name=record_name,
+                        record_type=record_type,
+                        ttl=record_set.ttl or 3600,
+                        rdata=rdata,
+                        fqdn=fqdn,
+                    )
+                )
+        except HttpResponseError as e:
+            if e.status_code != 404:
+                logger.warning("Could not list records in private zone %s: %s", zone_name, e)
         except Exception as e:
-            print(
-                f"Error getting record sets from private zone {zone_name} in {resource_group}: {e}"
+            logger.error(
+                "Error getting record sets from private zone %s in %s: %s",
+                zone_name, resource_group, e,
             )
 
         return records
 
+    # record_type -> (record set attribute, formatter for one entry of that list)
+    _RDATA_HANDLERS = {
+        "A": ("a_records", lambda rec: str(rec.ipv4_address)),
+        "AAAA": ("aaaa_records", lambda rec: str(rec.ipv6_address)),
+        "MX": ("mx_records", lambda rec: f"{rec.preference} {rec.exchange.rstrip('.')}"),
+        "NS": ("ns_records", lambda rec: rec.nsdname.rstrip(".")),
+        "PTR": ("ptr_records", lambda rec: rec.ptrdname.rstrip(".")),
+        "SRV": (
+            "srv_records",
+            lambda rec: f"{rec.priority} {rec.weight} {rec.port} {rec.target.rstrip('.')}",
+        ),
+        # TXT records can have multiple strings per record
+        "TXT": ("txt_records", lambda rec: " ".join(f'"{val}"' for val in rec.value or [])),
+        "CAA": ("caa_records", lambda rec: f'{rec.flags} {rec.tag} "{rec.value}"'),
+    }
+
+    # Types whose record set holds a single object rather than a list
+    _RDATA_SINGLE_HANDLERS = {
+        "CNAME": ("cname_record", lambda rec: rec.cname or ""),
+        "SOA": (
+            "soa_record",
+            lambda soa: (
+                f"{soa.host.rstrip('.')} {soa.email.rstrip('.')} {soa.serial_number} "
+                f"{soa.refresh_time} {soa.retry_time} {soa.expire_time} {soa.minimum_ttl}"
+            ),
+        ),
+    }
+
     def _format_rdata(self, record_set, record_type: str) -> str:
         """Format RDATA based on record type"""
-        rdata_parts = []
+        handler = self._RDATA_HANDLERS.get(record_type)
+        if handler is not None:
+            attr, fmt = handler
+            return ", ".join(fmt(rec) for rec in getattr(record_set, attr, None) or [])
 
-        if record_type == "A" and hasattr(record_set, "a_records"):
-            rdata_parts = [str(rec.ipv4_address) for rec in record_set.a_records or []]
-        elif record_type == "AAAA" and hasattr(record_set, "aaaa_records"):
-            rdata_parts = [
-                str(rec.ipv6_address) for rec in record_set.aaaa_records or []
-            ]
-        elif record_type == "CNAME" and hasattr(record_set, "cname_record"):
-            if record_set.cname_record:
-                rdata_parts = [record_set.cname_record.cname or ""]
-        elif record_type == "MX" and hasattr(record_set, "mx_records"):
-            rdata_parts = [
-                f"{rec.preference} {rec.exchange.rstrip('.')}"
-                for rec in record_set.mx_records or []
-            ]
-        elif record_type == "NS" and hasattr(record_set, "ns_records"):
-            rdata_parts = [rec.nsdname.rstrip(".") for rec in record_set.ns_records or []]
-        elif record_type == "PTR" and hasattr(record_set, "ptr_records"):
-            rdata_parts = [rec.ptrdname.rstrip(".") for rec in record_set.ptr_records or []]
-        elif record_type == "SRV" and hasattr(record_set, "srv_records"):
-            rdata_parts = [
-                f"{rec.priority} {rec.weight} {rec.port} {rec.target.rstrip('.')}"
-                for rec in record_set.srv_records or []
-            ]
-        elif record_type == "TXT" and hasattr(record_set, "txt_records"):
-            # TXT records can have multiple strings per record
-            rdata_parts = [
-                " ".join(f'"{val}"' for val in rec.value or [])
-                for rec in record_set.txt_records or []
-            ]
-        elif record_type == "CAA" and hasattr(record_set, "caa_records"):
-            rdata_parts = [
-                f'{rec.flags} {rec.tag} "{rec.value}"'
-                for rec in record_set.caa_records or []
-            ]
-        elif record_type == "SOA" and hasattr(record_set, "soa_record"):
-            if record_set.soa_record:
-                soa = record_set.soa_record
-                rdata_parts = [
-                    f"{soa.host.rstrip('.')} {soa.email.rstrip('.')} {soa.serial_number} "
-                    f"{soa.refresh_time} {soa.retry_time} {soa.expire_time} {soa.minimum_ttl}"
-                ]
+        handler = self._RDATA_SINGLE_HANDLERS.get(record_type)
+        if handler is not None:
+            attr, fmt = handler
+            rec = getattr(record_set, attr, None)
+            return fmt(rec) if rec else ""
 
-        return ", ".join(rdata_parts) if rdata_parts else ""
+        return ""
 
     def export_all_records(self, output_path: Path) -> int:
         """
@@ -402,12 +491,12 @@ class AzureDNSExporter:
         Returns:
             Number of records exported
         """
-        print("Starting Azure DNS export...")
+        logger.info("Starting Azure DNS export...")
 
         # Get subscriptions
         subscriptions = self._list_subscriptions()
         if not subscriptions:
-            print("No subscriptions found. Check your credentials and permissions.")
+            logger.error("No subscriptions found. Check your credentials and permissions.")
             return 0
 
         if self.subscription_id:
@@ -417,76 +506,133 @@ class AzureDNSExporter:
                 if s["subscription_id"] == self.subscription_id
             ]
             if not subscriptions:
-                print(
-                    f"Subscription {self.subscription_id} not found or not accessible."
+                logger.error(
+                    "Subscription %s not found or not accessible.", self.subscription_id
                 )
                 return 0
 
-        print(f"Found {len(subscriptions)} subscription(s)")
-
-        all_records: List[DNSRecord] = []
+        logger.info("Found %d subscription(s)", len(subscriptions))
 
-        # Iterate through subscriptions
-        for sub_info in subscriptions:
-            sub_id = sub_info["subscription_id"]
-            sub_name = sub_info["subscription_name"]
-            print(f"\nProcessing subscription: {sub_name} ({sub_id})")
+        # Write next to the target and swap it in only once the export is
+        # complete, so an empty, failed or interrupted run never truncates or
+        # removes a previous good export.
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        logger.info("Writing records to %s", output_path)
+        try:
+            record_count = self._write_records(tmp_path, subscriptions)
+            if record_count:
+                os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        if record_count:
+            logger.info("Export complete! %d record(s) written to %s", record_count, output_path)
+        else:
+            logger.warning("No records found to export; %s left unchanged.", output_path)
 
-            # Get all public DNS zones in this subscription
-            public_zones = self._list_all_public_dns_zones(sub_id)
-            print(f"  Found {len(public_zones)} public DNS zone(s)")
+        return record_count
 
-            for zone_info in public_zones:
-                zone_name = zone_info["name"]
-                rg = zone_info["resource_group"]
-                print(f"    Processing public DNS zone: {zone_name} (RG: {rg})")
-                records = self._get_record_sets_public(
-                    sub_id, sub_name, rg, zone_name
-                )
-                all_records.extend(records)
-                print(f"      Found {len(records)} record(s)")
-
-            # Get all private DNS zones in this subscription
-            private_zones = self._list_all_private_dns_zones(sub_id)
-            print(f"  Found {len(private_zones)} private DNS zone(s)")
-
-            for zone_info in private_zones:
-                zone_name = zone_info["name"]
-                rg = zone_info["resource_group"]
-                print(f"    Processing private DNS zone: {zone_name} (RG: {rg})")
-                records = self._get_record_sets_private(
-                    sub_id, sub_name, rg, zone_name
-                )
-                all_records.extend(records)
-                print(f"      Found {len(records)} record(s)")
-
-        # Write to CSV
-        print(f"\nWriting {len(all_records)} record(s) to {output_path}")
-        if all_records:
-            fieldnames = [
-                "Subscription ID",
-                "Subscription Name",
-                "Resource Group",
-                "Zone Name",
-                "Zone Type",
-                "Record Name",
-                "Record Type",
-                "TTL",
-                "RDATA",
-                "FQDN",
-            ]
-
-            with output_path.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for record in all_records:
-                    writer.writerow(record.to_dict())
+    def _write_records(self, path: Path, subscriptions: List[Dict[str, str]]) -> int:
+        """
+        Fetch every zone's record sets and write them to a CSV at path
 
-            print(f"Export complete! Records written to {output_path}")
-        else:
-            print("No records found to export.")
+        Returns:
+            Number of records written
+        """
+        record_count = 0
+
+        # Rows are written and dropped as each zone completes, so memory holds
+        # only the zones fetched but not yet written, not the whole tenant.
+        with path.open(
+            "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+        ) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+
+            # Requests are I/O-bound, so fan them out over a thread pool. The SDK's
+            # retry policy already backs off on 429s using Retry-After.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Finished futures of both stages arrive on one queue, so zone
+                # listings and record sets are handled in completion order and
+                # records are written while other listings are still running.
+                # Pending futures map to their stage and context; each entry is
+                # popped once handled so its result can be freed.
+                done_queue = queue.SimpleQueue()
+                pending = {}
+
+                def submit(context, fn, *args):
+                    future = executor.submit(fn, *args)
+                    pending[future] = context
+                    future.add_done_callback(done_queue.put)
+
+                # Stage 1: list public and private zones in every subscription
+                for sub_info in subscriptions:
+                    sub_id = sub_info["subscription_id"]
+                    submit(("zones", sub_info, "Public"), self._list_all_public_dns_zones, sub_id)
+                    submit(("zones", sub_info, "Private"), self._list_all_private_dns_zones, sub_id)
+
+                # Only this thread touches the writer, so no locking is needed.
+                # Per-zone detail is debug-only; progress is logged every
+                # PROGRESS_EVERY zones.
+                zones_found = 0
+                zones_done = 0
+                while pending:
+                    future = done_queue.get()
+                    stage, *context = pending.pop(future)
+
+                    if stage == "zones":
+                        # Stage 2: fetch record sets for each zone as soon as its listing arrives
+                        sub_info, zone_type = context
+                        zones = future.result()
+                        logger.info(
+                            "Found %d %s DNS zone(s) in %s (%s)",
+                            len(zones),
+                            zone_type.lower(),
+                            sub_info["subscription_name"],
+                            sub_info["subscription_id"],
+                        )
+                        get_record_sets = (
+                            self._get_record_sets_public
+                            if zone_type == "Public"
+                            else self._get_record_sets_private
+                        )
+                        for zone_info in zones:
+                            submit(
+                                ("records", zone_type, zone_info),
+                                get_record_sets,
+                                sub_info["subscription_id"],
+                                sub_info["subscription_name"],
+                                zone_info["resource_group"],
+                                zone_info["name"],
+                            )
+                        zones_found += len(zones)
+                        continue
+
+                    zone_type, zone_info = context
+                    records = future.result()
+                    writer.writerows(record.as_row() for record in records)
+                    record_count += len(records)
+                    zones_done += 1
+                    logger.debug(
+                        "Processed %s DNS zone: %s (RG: %s) - %d record(s)",
+                        zone_type.lower(),
+                        zone_info["name"],
+                        zone_info["resource_group"],
+                        len(records),
+                    )
+                    del records
+                    if zones_done % PROGRESS_EVERY == 0:
+                        logger.info(
+                            "Processed %d/%d zone(s) found so far, %d record(s)",
+                            zones_done, zones_found, record_count,
+                        )
+                if zones_done % PROGRESS_EVERY:
+                    logger.info(
+                        "Processed %d/%d zone(s), %d record(s)",
+                        zones_done, zones_found, record_count,
+                    )
 
-        return len(all_records)
+        return record_count
 
 
 def parse_args() -> argparse.Namespace:
@@ -505,9 +651,41 @@ def parse_args() -> argparse.Namespace:
         "--subscription-id",
         help="Optional: Limit to specific subscription ID (or set AZURE_SUBSCRIPTION_ID env var)",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=16,
+        help="Number of concurrent Azure API requests (default: 16)",
+    )
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Only log warnings and errors",
+    )
+    verbosity.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Also log every processed zone",
+    )
     return parser.parse_args()
 
 
+def configure_logging(args: argparse.Namespace) -> None:
+    """Send log output to stderr at the level selected by -q / -v"""
+    level = logging.INFO
+    if args.quiet:
+        level = logging.WARNING
+    elif args.verbose:
+        level = logging.DEBUG
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+
+
 def get_subscription_id(args: argparse.Namespace) -> Optional[str]:
     """Get subscription ID from args or environment variables"""
     return args.subscription_id or os.getenv("AZURE_SUBSCRIPTION_ID")
@@ -517,20 +695,21 @@ def main() -> None:
     """Main entry point"""
     try:
         args = parse_args()
+        configure_logging(args)
         subscription_id = get_subscription_id(args)
 
-        exporter = AzureDNSExporter(subscription_id=subscription_id)
+        exporter = AzureDNSExporter(
+            subscription_id=subscription_id, max_workers=args.max_workers
+        )
 
         record_count = exporter.export_all_records(args.output)
         sys.exit(0 if record_count > 0 else 1)
 
     except KeyboardInterrupt:
-        print("\n\nExport cancelled by user.")
+        logger.warning("Export cancelled by user.")
         sys.exit(130)
     except Exception as e:
-        print(f"\nError: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error: %s", e)
         sys.exit(1)
 
 
@@ -11,9 +11,19 @@ from __future__ import annotations
 
 import argparse
 import csv
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Callable, Iterable, List
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+# Keyword alternations, matched against already-lowercased text
+_CAA_ALLOW_RE = re.compile(r"sectigo|digicert|entrust")
+_EMAIL_RE = re.compile(r"mail|smtp")
+_SECURE_FTP_RE = re.compile(r"sftp|secureftp")
+
+# Header columns every export must have
+REQUIRED_COLUMNS = ("name", "type", "ttl", "rdata")
 
 
 @dataclass(frozen=True)
@@ -22,139 +32,188 @@ class Record:
     type: str
     ttl: str
     rdata: str
+    # Normalized copies used by the filters, computed once per record
+    type_upper: str = field(init=False, repr=False, compare=False)
+    name_lower: str = field(init=False, repr=False, compare=False)
+    rdata_lower: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def type_upper(self) -> str:
-        return self.type.upper()
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "type_upper", self.type.upper())
+        object.__setattr__(self, "name_lower", self.name.lower())
+        object.__setattr__(self, "rdata_lower", self.rdata.lower())
 
-    @property
-    def name_lower(self) -> str:
-        return self.name.lower()
 
-    @property
-    def rdata_lower(self) -> str:
-        return self.rdata.lower()
+def stream_records(csv_path: Path) -> Iterator[Record]:
+    """Yield records one row at a time; the file stays open until exhausted.
 
-
-def load_records(csv_path: Path) -> List[Record]:
+    An empty file yields nothing. Raises ValueError if the header lacks any
+    of REQUIRED_COLUMNS.
+    """
     with csv_path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        return [
-            Record(
-                name=row["name"].strip(),
-                type=row["type"].strip(),
-                ttl=row["ttl"].strip(),
-                rdata=row["rdata"].strip(),
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        if not header:
+            return
+        # Column positions are looked up once rather than per row by name
+        index = {column: i for i, column in enumerate(header)}
+        missing = [column for column in REQUIRED_COLUMNS if column not in index]
+        if missing:
+            raise ValueError(f"{csv_path}: missing required column(s): {', '.join(missing)}")
+        name_i, type_i, ttl_i, rdata_i = (index[column] for column in REQUIRED_COLUMNS)
+        for row in reader:
+            if not row:
+                continue
+            yield Record(
+                name=row[name_i].strip(),
+                type=row[type_i].strip(),
+                ttl=row[ttl_i].strip(),
+                rdata=row[rdata_i].strip(),
             )
-            for row in reader
-        ]
 
 
-def filter_caa_exceptions(records: Iterable[Record]) -> List[Record]:
-    allow_keywords = ("sectigo", "digicert", "entrust")
-    matches: List[Record] = []
-    for record in records:
-        if record.type_upper != "CAA":
-            continue
-        for chunk in (part.strip() for part in record.rdata.split(",")):
-            lowered = chunk.lower()
-            if "issue" not in lowered:
-                continue
-            if "issuewild" in lowered:
-                continue
-            if any(keyword in lowered for keyword in allow_keywords):
-                continue
-            matches.append(
-                Record(
-                    name=record.name,
-                    type=record.type,
-                    ttl=record.ttl,
-                    rdata=chunk,
-                )
-            )
-    return matches
+def load_records(csv_path: Path) -> List[Record]:
+    return list(stream_records(csv_path))
 
 
-def filter_email(records: Iterable[Record]) -> List[Record]:
-    substrings = ("mail", "smtp")
-    matches: List[Record] = []
-    for record in records:
-        if record.type_upper == "MX":
-            matches.append(record)
+def caa_exceptions(record: Record) -> List[str]:
+    """Return the non-allowed "issue" entries of a CAA record's RDATA"""
+    matches: List[str] = []
+    if record.type_upper != "CAA":
+        return matches
+    for chunk in (part.strip() for part in record.rdata.split(",")):
+        lowered = chunk.lower()
+        if "issue" not in lowered:
             continue
-        if any(sub in record.name_lower for sub in substrings):
-            matches.append(record)
+        if "issuewild" in lowered:
             continue
-        if any(sub in record.rdata_lower for sub in substrings):
-            matches.append(record)
+        if _CAA_ALLOW_RE.search(lowered):
+            continue
+        matches.append(chunk)
     return matches
 
 
+def is_email(record: Record) -> bool:
+    if record.type_upper == "MX":
+        return True
+    return bool(_EMAIL_RE.search(record.name_lower) or _EMAIL_RE.search(record.rdata_lower))
+
+
+def is_ftp(record: Record) -> bool:
+    name_lower = record.name_lower
+    if "ftp" not in name_lower:
+        return False
+    return not _SECURE_FTP_RE.search(name_lower)
+
+
+def is_ns(record: Record) -> bool:
+    return record.type_upper == "NS"
+
+
+def is_relay(record: Record) -> bool:
+    return "relay" in record.name_lower
+
+
+def is_sendgrid(record: Record) -> bool:
+    return "sendgrid" in record.name_lower or "sendgrid" in record.rdata_lower
+
+
+def is_tor(record: Record) -> bool:
+    return "tor" in record.name_lower
+
+
+def filter_caa_exceptions(records: Iterable[Record]) -> List[Record]:
+    return [
+        replace(record, rdata=chunk)
+        for record in records
+        for chunk in caa_exceptions(record)
+    ]
+
+
+def filter_email(records: Iterable[Record]) -> List[Record]:
+    return [record for record in records if is_email(record)]
+
+
 def filter_ftp(records: Iterable[Record]) -> List[Record]:
-    matches: List[Record] = []
-    for record in records:
-        name_lower = record.name_lower
-        if "ftp" not in name_lower:
-            continue
-        if "sftp" in name_lower or "secureftp" in name_lower:
-            continue
-        matches.append(record)
-    return matches
+    return [record for record in records if is_ftp(record)]
 
 
 def filter_ns(records: Iterable[Record]) -> List[Record]:
-    return [record for record in records if record.type_upper == "NS"]
+    return [record for record in records if is_ns(record)]
 
 
 def filter_relay(records: Iterable[Record]) -> List[Record]:
-    return [record for record in records if "relay" in record.name_lower]
+    return [record for record in records if is_relay(record)]
 
 
 def filter_sendgrid(records: Iterable[Record]) -> List[Record]:
-    return [
-        record
-        for record in records
-        if "sendgrid" in record.name_lower or "sendgrid" in record.rdata_lower
-    ]
+    return [record for record in records if is_sendgrid(record)]
 
 
 def filter_tor(records: Iterable[Record]) -> List[Record]:
-    return [record for record in records if "tor" in record.name_lower]
+    return [record for record in records if is_tor(record)]
 
 
 def format_section(title: str, records: List[Record]) -> str:
+    return format_rows(title, [(record, record.rdata) for record in records])
+
+
+def format_rows(title: str, rows: List[Tuple[Record, str]]) -> str:
+    """Format (record, rdata) rows; rdata may be a single part of record.rdata"""
     header = f"=== {title} ==="
-    if not records:
+    if not rows:
         return f"{header}\n(no matches)\n"
 
-    sorted_records = sorted(records, key=lambda r: (r.name_lower, r.type_upper))
-    name_width = max(len(r.name) for r in sorted_records)
-    type_width = max(len(r.type) for r in sorted_records)
-    ttl_width = max(len(r.ttl) for r in sorted_records)
-
-    lines = [header, f"{'Name'.ljust(name_width)}  {'Type'.ljust(type_width)}  {'TTL'.ljust(ttl_width)}  RDATA"]
-    for record in sorted_records:
-        lines.append(
-            f"{record.name.ljust(name_width)}  "
-            f"{record.type.ljust(type_width)}  "
-            f"{record.ttl.ljust(ttl_width)}  "
-            f"{record.rdata}"
-        )
+    sorted_rows = sorted(rows, key=lambda row: (row[0].name_lower, row[0].type_upper))
+    name_width = type_width = ttl_width = 0
+    for record, _ in sorted_rows:
+        if len(record.name) > name_width:
+            name_width = len(record.name)
+        if len(record.type) > type_width:
+            type_width = len(record.type)
+        if len(record.ttl) > ttl_width:
+            ttl_width = len(record.ttl)
+
+    lines = [header, f"{'Name':<{name_width}}  {'Type':<{type_width}}  {'TTL':<{ttl_width}}  RDATA"]
+    lines.extend(
+        f"{record.name:<{name_width}}  {record.type:<{type_width}}  {record.ttl:<{ttl_width}}  {rdata}"
+        for record, rdata in sorted_rows
+    )
     lines.append("")
     return "\n".join(lines)
 
 
-def build_report(records: List[Record]) -> str:
+def build_report(records: Iterable[Record]) -> str:
+    # One pass over the records, sorting each into every section it matches.
+    # Sections hold (record, rdata) rows so CAA matches can carry just the
+    # offending part of the RDATA without copying the record.
+    caa, email, ftp, ns, relay, sendgrid, tor = ([] for _ in range(7))
+    for record in records:
+        row = (record, record.rdata)
+        if record.type_upper == "CAA":
+            caa.extend((record, chunk) for chunk in caa_exceptions(record))
+        if is_email(record):
+            email.append(row)
+        if is_ftp(record):
+            ftp.append(row)
+        if is_ns(record):
+            ns.append(row)
+        if is_relay(record):
+            relay.append(row)
+        if is_sendgrid(record):
+            sendgrid.append(row)
+        if is_tor(record):
+            tor.append(row)
+
     sections = [
-        ("CAA Issue Records (non-allowed)", filter_caa_exceptions(records)),
-        ("Email Records", filter_email(records)),
-        ("FTP Records", filter_ftp(records)),
-        ("NS Records", filter_ns(records)),
-        ("Relay Records", filter_relay(records)),
-        ("Sendgrid Records", filter_sendgrid(records)),
-        ("Tor Records", filter_tor(records)),
+        ("CAA Issue Records (non-allowed)", caa),
+        ("Email Records", email),
+        ("FTP Records", ftp),
+        ("NS Records", ns),
+        ("Relay Records", relay),
+        ("Sendgrid Records", sendgrid),
+        ("Tor Records", tor),
     ]
-    return "\n".join(format_section(title, subset) for title, subset in sections).strip() + "\n"
+    return "\n".join(format_rows(title, subset) for title, subset in sections).strip() + "\n"
 
 
 def parse_args() -> argparse.Namespace:
@@ -169,8 +228,11 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    records = load_records(args.csv_path.expanduser().resolve())
-    report = build_report(records)
+    records = stream_records(args.csv_path.expanduser().resolve())
+    try:
+        report = build_report(records)
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
     print(report)
 
 
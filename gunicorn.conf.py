@@ -0,0 +1,18 @@
+"""
+Gunicorn settings for the inventory API (picked up automatically by
+``gunicorn wsgi:app`` when run from the project directory)
+"""
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5001")
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Inventory data and its caches live in process memory, and /api/load-data
+# only refreshes the worker that handles it. Keep a single threaded worker by
+# default; raise WEB_CONCURRENCY only when the data is loaded once at startup.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# Import the app (and build its indexes) once in the master so forked workers
+# share the parsed data copy-on-write.
+preload_app = True
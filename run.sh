@@ -31,7 +31,7 @@ fi
 
 # Start Flask API in background
 echo "🔧 Starting Flask API server..."
-python3 app.py &
+gunicorn wsgi:app &
 FLASK_PID=$!
 
 # Wait a moment for Flask to start
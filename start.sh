@@ -14,7 +14,7 @@ sleep 2
 
 # Start Flask API
 echo "🔧 Starting Flask API on port 5001..."
-python3 app.py &
+gunicorn wsgi:app &
 FLASK_PID=$!
 
 # Wait for Flask to start
@@ -3,8 +3,8 @@ Streamlit Dashboard for DCV Certificate Validation
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
-from datetime import datetime
 import os
 
 # Page configuration
@@ -24,49 +24,186 @@ tab = st.sidebar.radio(
 )
 
 # Helper functions
-def parse_expiration_date(exp_str):
-    """Parse expiration date in ISO 8601 or MM-DD-YY format."""
-    if not exp_str:
-        return None
+def parse_expiration_dates(exp):
+    """Parse a Series of ISO 8601 or MM-DD-YY expiration strings; unparseable -> NaT."""
     # Remove trailing 'z' or 'Z'
-    exp_str = exp_str.rstrip('zZ')
-    try:
-        # Try ISO 8601 first (for Akamai data)
-        return datetime.fromisoformat(exp_str)
-    except ValueError:
-        pass
-    try:
-        # Try MM-DD-YY format (for combined_certs.json)
-        dt = datetime.strptime(exp_str, "%m-%d-%y")
-        # If year is in the past, assume it's in the next century
-        if dt.year < 2000:
-            dt = dt.replace(year=dt.year + 100)
-        return dt
-    except Exception:
-        return None
-
-def calculate_days_remaining(exp_str):
-    """Calculate days remaining until expiration"""
-    exp_date = parse_expiration_date(exp_str)
-    if exp_date:
-        delta = exp_date - datetime.now()
-        return delta.days
-    return None
+    exp = exp.astype('string').str.rstrip('zZ')
+    # MM-DD-YY (combined_certs.json) is recognised by shape, so each string
+    # goes through exactly one parser instead of failing ISO parsing first
+    is_legacy = exp.str.fullmatch(r'\d{1,2}-\d{1,2}-\d{2}', na=False)
+    # ISO 8601 (Akamai data)
+    parsed = pd.to_datetime(exp.mask(is_legacy), format='ISO8601', errors='coerce')
+    legacy = pd.to_datetime(exp.where(is_legacy), format='%m-%d-%y', errors='coerce')
+    # If year is in the past, assume it's in the next century
+    legacy = legacy.where(legacy.isna() | (legacy.dt.year >= 2000), legacy + pd.DateOffset(years=100))
+    return parsed.fillna(legacy)
+
+def expiry_columns(exp, now):
+    """Return (display strings, days remaining) for a Series of expiration strings.
+
+    Days remaining are nullable Int32, so missing dates stay <NA> rather than
+    promoting the column to float64.
+    """
+    days = (parse_expiration_dates(exp) - now).dt.days
+    has_exp = exp.notna() & (exp.astype('string') != '')
+    exp_str = exp.astype('string')
+    days_str = days.astype('Int64').astype('string')
+    # Suppress negative hundreds of days for display
+    display = pd.Series(
+        np.where(
+            ~has_exp | days.isna(),
+            '—',
+            np.where(days < 0, exp_str + ' (Expired)', exp_str + ' (' + days_str + 'd)'),
+        ),
+        index=exp.index,
+    )
+    return display, days.astype('Int32')
+
+# Readers are cached across reruns; the file's mtime is part of the cache key
+# so an updated file is picked up on the next rerun.
+@st.cache_data(show_spinner=False)
+def read_combined_certs(json_path, mtime):
+    """Read combined_certs.json into a flat frame with a lowercased domain column."""
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    certs = pd.json_normalize(data).reindex(columns=[
+        'domain',
+        'digicert.status', 'digicert.expiration',
+        'sectigo.status', 'sectigo.expiration',
+    ])
+    certs['domain'] = certs['domain'].fillna('').astype(str)
+    # Lowercased once here so filtering is a plain substring scan per rerun
+    certs['_domain_lower'] = certs['domain'].str.lower()
+    return certs
+
+@st.cache_data(show_spinner=False)
+def read_akamai_sans(csv_path, mtime):
+    """Read the Akamai CSV with parsed expiry dates and the issuer options
+    for the filter."""
+    df = pd.read_csv(csv_path)
+    df['Parsed_Date'] = pd.to_datetime(df['Expiration Date'], format='%Y-%m-%d', errors='coerce')
+    # Soonest expiry first; filtering keeps this order, so the table needs no sort
+    df = df.sort_values('Parsed_Date', kind='stable')
+    # Lowercased SAN/issuer/deployments joined on a unit separator, so a
+    # search is one substring scan instead of three case-insensitive ones
+    df['_search'] = (
+        df['SAN'].fillna('') + '\x1f'
+        + df['Issuer'].fillna('') + '\x1f'
+        + df['Certificate Deployments'].fillna('')
+    ).str.lower()
+    # Arrow-backed strings reach st.dataframe as ready Arrow buffers rather
+    # than object cells converted one at a time on every rerun
+    for col in ['SAN', 'Expiration Date', 'Certificate Deployments', '_search']:
+        df[col] = df[col].astype('string[pyarrow]')
+    # Few distinct issuers: categorical codes make isin() and nunique() cheap
+    df['Issuer'] = df['Issuer'].astype('category')
+    return df, df['Issuer'].unique().tolist()
+
+# Expiry font colors indexed by bucket: unknown, expired or ≤30 days, ≤60 days, later
+EXPIRY_CSS = np.array([
+    '',
+    'color: red; font-weight: bold;',
+    'color: orange; font-weight: bold;',
+    'color: green; font-weight: bold;',
+])
+EXPIRY_BUCKET_EDGES = [30, 60]
+
+def expiry_css(days):
+    """Font color CSS for each value of a days-remaining Series ('' when unknown)."""
+    days = days.to_numpy(dtype=float, na_value=np.nan)
+    buckets = np.searchsorted(EXPIRY_BUCKET_EDGES, days) + 1
+    buckets[np.isnan(days)] = 0
+    return EXPIRY_CSS[buckets]
 
 def load_combined_certs():
     """Load combined certificates data from JSON"""
     json_path = os.path.join('data', 'combined_certs.json')
     if os.path.exists(json_path):
-        with open(json_path, 'r') as f:
-            return json.load(f)
-    return []
+        return read_combined_certs(json_path, os.path.getmtime(json_path))
+    return None
 
 def load_akamai_sans():
-    """Load Akamai SANs data from CSV in the data directory"""
+    """Load Akamai SANs data and issuer list from CSV in the data directory"""
     csv_path = os.path.join('data', 'akamai_san.csv')
     if os.path.exists(csv_path):
-        return pd.read_csv(csv_path)
-    return None
+        key = (csv_path, os.path.getmtime(csv_path))
+        # st.cache_data hands back a fresh copy on every hit; keep this
+        # session's copy so plain reruns reuse it.
+        if st.session_state.get('akamai_key') != key:
+            st.session_state['akamai_data'] = read_akamai_sans(*key)
+            st.session_state['akamai_key'] = key
+        df, issuers = st.session_state['akamai_data']
+        # Measured from the current time on every rerun, as expiry_columns does
+        # for the Dashboard, so both tabs agree on days remaining
+        df['Days_Remaining'] = (df['Parsed_Date'] - pd.Timestamp.now()).dt.days
+        return df, issuers
+    return None, []
+
+def akamai_search_mask(akamai_df, needle):
+    """Boolean mask of rows whose _search blob contains needle (lowercase).
+
+    Typing usually extends the previous search, and any row matching the
+    longer text also matched the shorter one, so only the rows the last
+    mask kept are scanned again. The last (data key, needle, mask) is kept
+    in session state.
+    """
+    key = st.session_state.get('akamai_key')
+    last = st.session_state.get('akamai_search')
+    if last is not None and last[0] == key and last[1] in needle:
+        rows = np.flatnonzero(last[2])
+    else:
+        rows = np.arange(len(akamai_df))
+    mask = np.zeros(len(akamai_df), dtype=bool)
+    mask[rows] = akamai_df['_search'].iloc[rows].str.contains(needle, regex=False).to_numpy(dtype=bool)
+    st.session_state['akamai_search'] = (key, needle, mask)
+    return mask
+
+# Filters and table rerun on their own when a filter changes; the stats
+# above them are left alone (requires Streamlit 1.37+).
+@st.fragment
+def akamai_table(akamai_df, issuers):
+    """Render the Akamai search/issuer filters and the filtered SAN table."""
+    # Add filters
+    col1, col2 = st.columns([2, 2])
+    with col1:
+        search_text = st.text_input("🔍 Search SANs", placeholder="Enter SAN, issuer, or deployment...")
+    with col2:
+        issuer_filter = st.multiselect(
+            "Filter by Issuer",
+            options=issuers,
+            default=[]
+        )
+
+    # Apply filters as one combined mask, then slice once
+    mask = np.ones(len(akamai_df), dtype=bool)
+
+    if search_text:
+        mask &= akamai_search_mask(akamai_df, search_text.lower())
+
+    if issuer_filter:
+        mask &= akamai_df['Issuer'].isin(issuer_filter).to_numpy()
+
+    # Format the display dataframe
+    display_df = akamai_df.loc[mask, ['SAN', 'Expiration Date', 'Issuer', 'Certificate Deployments', 'Days_Remaining']].copy()
+    days_remaining = display_df.pop('Days_Remaining')
+    display_df['Days Remaining'] = (
+        days_remaining.astype('Int64').astype('string') + ' days'
+    ).fillna('N/A')
+
+    # Style the dataframe: color only the Expiration Date and Days Remaining columns
+    # Both columns share one CSS lookup
+    expiry_styles = pd.Series(expiry_css(days_remaining), index=days_remaining.index)
+    styled_df = display_df.style.apply(
+        lambda col: expiry_styles.loc[col.index],
+        subset=['Expiration Date', 'Days Remaining'],
+    )
+
+    # Display table
+    st.dataframe(
+        styled_df,
+        use_container_width=True,
+        height=600
+    )
 
 # Dashboard Tab
 if tab == "Dashboard":
@@ -74,9 +211,9 @@ if tab == "Dashboard":
     st.markdown("---")
 
     # Load data
-    data = load_combined_certs()
+    certs = load_combined_certs()
 
-    if data:
+    if certs is not None and not certs.empty:
         # Add filter
         col1, col2 = st.columns([3, 1])
         with col1:
@@ -84,62 +221,35 @@ if tab == "Dashboard":
         with col2:
             sort_by_expiry = st.checkbox("Sort by expiry", value=False)
 
-        # Process data
-        processed_data = []
-        for item in data:
-            domain = item.get('domain', '')
-
-            # Apply filter
-            if filter_text and filter_text.lower() not in domain.lower():
-                continue
-
-            digicert = item.get('digicert', {})
-            sectigo = item.get('sectigo', {})
-
-            digicert_status = digicert.get('status', 'unknown')
-            digicert_exp = digicert.get('expiration')
-            digicert_days = calculate_days_remaining(digicert_exp) if digicert_exp else None
-
-            sectigo_status = sectigo.get('status', 'unknown')
-            sectigo_exp = sectigo.get('expiration')
-            sectigo_days = calculate_days_remaining(sectigo_exp) if sectigo_exp else None
-
-            # Suppress negative hundreds of days for display
-            def expiry_display(exp, days):
-                if not exp or days is None:
-                    return '—'
-                elif days < 0:
-                    return f"{exp} (Expired)"
-                else:
-                    return f"{exp} ({days}d)"
-
-            # Calculate min days for sorting (non-negative values only)
-            days_list = [d for d in [digicert_days, sectigo_days] if d is not None and d >= 0]
-            min_days = min(days_list) if days_list else float('inf')
-
-            processed_data.append({
-                'Domain': domain,
-                'DigiCert Status': digicert_status,
-                'DigiCert Expiry': expiry_display(digicert_exp, digicert_days),
-                'DigiCert Days': digicert_days if digicert_days is not None and digicert_days >= 0 else None,
-                'Sectigo Status': sectigo_status,
-                'Sectigo Expiry': expiry_display(sectigo_exp, sectigo_days),
-                'Sectigo Days': sectigo_days if sectigo_days is not None and sectigo_days >= 0 else None,
-                'min_days': min_days
-            })
-
-        # Sort if requested
+        # Apply filter
+        if filter_text:
+            certs = certs[certs['_domain_lower'].str.contains(filter_text.lower(), regex=False)]
+
+        now = pd.Timestamp.now()
+        digicert_expiry, digicert_days = expiry_columns(certs['digicert.expiration'], now)
+        sectigo_expiry, sectigo_days = expiry_columns(certs['sectigo.expiration'], now)
+
+        df = pd.DataFrame({
+            'Domain': certs['domain'],
+            'DigiCert Status': certs['digicert.status'].fillna('unknown'),
+            'DigiCert Expiry': digicert_expiry,
+            'DigiCert Days': digicert_days,
+            'Sectigo Status': certs['sectigo.status'].fillna('unknown'),
+            'Sectigo Expiry': sectigo_expiry,
+            'Sectigo Days': sectigo_days,
+        })
+
+        # Sort if requested, on the soonest non-negative expiry (missing last)
         if sort_by_expiry:
-            processed_data.sort(key=lambda x: x['min_days'])
-
-        # Remove the sorting helper column
-        for item in processed_data:
-            del item['min_days']
+            days = df[['DigiCert Days', 'Sectigo Days']]
+            min_days = days.where(days >= 0).min(axis=1)
+            df = df.loc[min_days.sort_values(kind='stable', na_position='last').index]
+        df = df.reset_index(drop=True)
 
         # Display stats
-        total_domains = len(processed_data)
-        validated_digicert = sum(1 for item in processed_data if item['DigiCert Status'] == 'validated')
-        validated_sectigo = sum(1 for item in processed_data if item['Sectigo Status'] == 'validated')
+        total_domains = len(df)
+        validated_digicert = int((df['DigiCert Status'] == 'validated').sum())
+        validated_sectigo = int((df['Sectigo Status'] == 'validated').sum())
 
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -152,36 +262,17 @@ if tab == "Dashboard":
         st.markdown("---")
 
         # Display table
-        if processed_data:
-            df = pd.DataFrame(processed_data)
-
-            # Style the dataframe with colors for expiry columns (font color only)
-            def color_expiry_text(val, days):
-                if days is None or val in ['—', None]:
-                    return ''
-                elif days < 0:
-                    return 'color: red; font-weight: bold;'
-                elif days <= 30:
-                    return 'color: red; font-weight: bold;'
-                elif days <= 60:
-                    return 'color: orange; font-weight: bold;'
-                else:
-                    return 'color: green; font-weight: bold;'
-
-            def style_expiry_cols(row):
-                styles = [''] * len(row)
-                if 'DigiCert Expiry' in row and 'DigiCert Days' in row:
-                    idx = row.index.get_loc('DigiCert Expiry')
-                    styles[idx] = color_expiry_text(row['DigiCert Expiry'], row['DigiCert Days'])
-                if 'Sectigo Expiry' in row and 'Sectigo Days' in row:
-                    idx = row.index.get_loc('Sectigo Expiry')
-                    styles[idx] = color_expiry_text(row['Sectigo Expiry'], row['Sectigo Days'])
-                return styles
-
+        if total_domains:
             # Remove helper columns from display
             display_df = df.drop(columns=['DigiCert Days', 'Sectigo Days'])
 
-            styled_df = display_df.style.apply(style_expiry_cols, axis=1)
+            # Style the dataframe with colors for expiry columns (font color only),
+            # one vectorized call per column
+            styled_df = (
+                display_df.style
+                .apply(lambda _: expiry_css(df['DigiCert Days']), subset=['DigiCert Expiry'])
+                .apply(lambda _: expiry_css(df['Sectigo Days']), subset=['Sectigo Expiry'])
+            )
 
             st.dataframe(
                 styled_df,
@@ -213,19 +304,16 @@ elif tab == "Akamai DCV":
     st.markdown("---")
 
     # Load Akamai SANs data
-    akamai_df = load_akamai_sans()
+    akamai_df, issuers = load_akamai_sans()
 
     if akamai_df is not None:
         # Display summary stats
         total_sans = len(akamai_df)
 
-        # Parse expiration dates and calculate stats
-        akamai_df['Parsed_Date'] = pd.to_datetime(akamai_df['Expiration Date'], format='%Y-%m-%d', errors='coerce')
-        today = pd.Timestamp.now()
-        akamai_df['Days_Remaining'] = (akamai_df['Parsed_Date'] - today).dt.days
-
-        expiring_soon = len(akamai_df[akamai_df['Days_Remaining'] <= 30])
-        expired = len(akamai_df[akamai_df['Days_Remaining'] < 0])
+        # Calculate stats (dates are parsed once in read_akamai_sans)
+        days = akamai_df['Days_Remaining'].to_numpy()
+        expiring_soon = int((days <= 30).sum())
+        expired = int((days < 0).sum())
 
         col1, col2, col3, col4 = st.columns(4)
         with col1:
@@ -235,81 +323,12 @@ elif tab == "Akamai DCV":
         with col3:
             st.metric("Expired", expired)
         with col4:
-            unique_issuers = akamai_df['Issuer'].nunique()
+            unique_issuers = len(akamai_df['Issuer'].cat.categories)
             st.metric("Unique Issuers", unique_issuers)
 
         st.markdown("---")
 
-        # Add filters
-        col1, col2 = st.columns([2, 2])
-        with col1:
-            search_text = st.text_input("🔍 Search SANs", placeholder="Enter SAN, issuer, or deployment...")
-        with col2:
-            issuer_filter = st.multiselect(
-                "Filter by Issuer",
-                options=akamai_df['Issuer'].unique().tolist(),
-                default=[]
-            )
-
-        # Apply filters
-        filtered_df = akamai_df.copy()
-
-        if search_text:
-            mask = (
-                filtered_df['SAN'].str.contains(search_text, case=False, na=False) |
-                filtered_df['Issuer'].str.contains(search_text, case=False, na=False) |
-                filtered_df['Certificate Deployments'].str.contains(search_text, case=False, na=False)
-            )
-            filtered_df = filtered_df[mask]
-
-        if issuer_filter:
-            filtered_df = filtered_df[filtered_df['Issuer'].isin(issuer_filter)]
-
-        # Format the display dataframe
-        display_df = filtered_df[['SAN', 'Expiration Date', 'Issuer', 'Certificate Deployments', 'Days_Remaining']].copy()
-        display_df['Days Remaining'] = display_df['Days_Remaining'].apply(
-            lambda x: f"{int(x)} days" if pd.notna(x) else "N/A"
-        )
-        display_df = display_df.drop(columns=['Days_Remaining'])
-
-        # Sort by expiration date (soonest first)
-        display_df = display_df.sort_values('Expiration Date')
-
-        # Style the dataframe: color only the Expiration Date and Days Remaining columns
-        def color_expiry_text(val, days):
-            if pd.isna(days):
-                return ''
-            elif days < 0:
-                return 'color: red; font-weight: bold;'
-            elif days <= 30:
-                return 'color: red; font-weight: bold;'
-            elif days <= 60:
-                return 'color: orange; font-weight: bold;'
-            else:
-                return 'color: green; font-weight: bold;'
-
-        def style_expiry_cols(row):
-            styles = [''] * len(row)
-            # Expiry date
-            if 'Expiration Date' in row and 'Days Remaining' in row:
-                idx_exp = row.index.get_loc('Expiration Date')
-                try:
-                    days = int(str(row['Days Remaining']).split()[0])
-                except Exception:
-                    days = None
-                styles[idx_exp] = color_expiry_text(row['Expiration Date'], days)
-                idx_days = row.index.get_loc('Days Remaining')
-                styles[idx_days] = color_expiry_text(row['Expiration Date'], days)
-            return styles
-
-        styled_df = display_df.style.apply(style_expiry_cols, axis=1)
-
-        # Display table
-        st.dataframe(
-            styled_df,
-            use_container_width=True,
-            height=600
-        )
+        akamai_table(akamai_df, issuers)
 
         # Legend
         st.markdown("---")
@@ -6,6 +6,14 @@ Test script to verify the IT Inventory Dashboard is working correctly
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+def fetch(session, url):
+    """GET url, returning (response, None) or (None, error)"""
+    try:
+        return session.get(url, timeout=5), None
+    except requests.exceptions.RequestException as e:
+        return None, e
 
 def test_api_endpoints():
     """Test all API endpoints"""
@@ -17,30 +25,45 @@ def test_api_endpoints():
         "systems",
         "systems/issues"
     ]
+    bu_endpoint = "business-units/CTIO"
+    # Unknown API paths must 404, not be swallowed by the CORS preflight handling
+    missing_endpoint = "nonexistent"
     
     print("🧪 Testing API endpoints...")
     
-    for endpoint in endpoints:
-        try:
-            response = requests.get(f"{base_url}/{endpoint}", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                print(f"✅ {endpoint}: OK ({len(str(data))} chars)")
-            else:
-                print(f"❌ {endpoint}: HTTP {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {endpoint}: {e}")
+    # Probe every endpoint at once over one keep-alive session, so the run
+    # takes about as long as the slowest request instead of their sum
+    urls = [f"{base_url}/{endpoint}" for endpoint in endpoints + [bu_endpoint, missing_endpoint]]
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        results = list(pool.map(lambda url: fetch(session, url), urls))
     
-    # Test business unit details
-    try:
-        response = requests.get(f"{base_url}/business-units/CTIO", timeout=5)
-        if response.status_code == 200:
+    for endpoint, (response, error) in zip(endpoints, results):
+        if error is not None:
+            print(f"❌ {endpoint}: {error}")
+        elif response.status_code == 200:
             data = response.json()
-            print(f"✅ business-units/CTIO: OK ({len(data.get('systems', []))} systems)")
+            print(f"✅ {endpoint}: OK ({len(str(data))} chars)")
         else:
-            print(f"❌ business-units/CTIO: HTTP {response.status_code}")
-    except requests.exceptions.RequestException as e:
-        print(f"❌ business-units/CTIO: {e}")
+            print(f"❌ {endpoint}: HTTP {response.status_code}")
+    
+    # Test business unit details
+    response, error = results[-2]
+    if error is not None:
+        print(f"❌ {bu_endpoint}: {error}")
+    elif response.status_code == 200:
+        data = response.json()
+        print(f"✅ {bu_endpoint}: OK ({len(data.get('systems', []))} systems)")
+    else:
+        print(f"❌ {bu_endpoint}: HTTP {response.status_code}")
+    
+    # Test that unknown endpoints are not found
+    response, error = results[-1]
+    if error is not None:
+        print(f"❌ {missing_endpoint}: {error}")
+    elif response.status_code == 404:
+        print(f"✅ {missing_endpoint}: OK (HTTP 404)")
+    else:
+        print(f"❌ {missing_endpoint}: expected HTTP 404, got {response.status_code}")
 
 def test_streamlit():
     """Test if Streamlit is accessible"""